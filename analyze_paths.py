@@ -1,105 +1,319 @@
 """
 Analyze NetExec codebase for path dependencies.
 This helps identify what needs to be patched for path independence.
+
+If python-hyperscan is installed it is used for the pattern sweep,
+otherwise the stdlib re module is used.
 """
 
+import mmap
 import os
 import re
+import subprocess
+import sys
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict, Set
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Patterns to search for
+PATH_PATTERNS = {
+    '__file__': r'__file__',
+    'os.getcwd()': r'os\.getcwd\(\)',
+    'os.path.dirname': r'os\.path\.dirname',
+    'os.path.abspath': r'os\.path\.abspath',
+    'os.path.join': r'os\.path\.join',
+    'open(': r'\bopen[^\S\n]*\(',
+    'Path(': r'\bPath[^\S\n]*\(',
+    'pkg_resources': r'pkg_resources',
+    'importlib.resources': r'importlib\.resources',
+}
+
+# All patterns fused into one alternation so each file is scanned in a single pass.
+# Each pattern is wrapped in exactly one group, so match.lastindex - 1 is its index
+# into _PATTERN_NAMES, the same integer token the Hyperscan backend reports.
+_PATTERN_NAMES = tuple(sys.intern(name) for name in PATH_PATTERNS)
+# Compiled as bytes patterns so they can run directly over a memory-mapped file.
+_PATH_RE = re.compile(rb'|'.join(rb'(%b)' % pattern.encode() for pattern in PATH_PATTERNS.values()))
+_NEWLINE_RE = re.compile(rb'\n')
+
+
+def _compile_hyperscan():
+    """Build a Hyperscan database matching all patterns in one pass, or None if unavailable"""
+    if hyperscan is None:
+        return None
+    
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode() for pattern in PATH_PATTERNS.values()],
+            ids=list(range(len(PATH_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(PATH_PATTERNS),
+        )
+        return db
+    except Exception as e:
+        print(f"Warning: Hyperscan unavailable, falling back to re: {e}")
+        return None
+
+
+_HYPERSCAN_DB = _compile_hyperscan()
+
 
+# Imports are expected in the module header, so only this much of each file is read,
+# and reading stops early at the first top-level definition
+IMPORT_PEEK_SIZE = 16384
+CODE_STARTS = ('def ', 'async def ', 'class ', '@')
 
-def find_path_usages(directory: Path) -> Dict[str, List[Dict]]:
+# A single path-operation hit; tuple-backed so hits are cheap to allocate and pickle
+Issue = namedtuple('Issue', 'line pattern content')
+
+EXCLUDED_DIRS = {'__pycache__', 'venv', '.venv', '.git', 'node_modules'}
+DATA_EXTENSIONS = ('.txt', '.yaml', '.yml', '.json', '.xml', '.conf', '.cfg', '.ini')
+
+
+def _git_files(directory: Path) -> list[str] | None:
+    """
+    List the tracked Python and data files under directory via `git ls-files`,
+    relative to directory. Returns None when git or a work tree is unavailable.
+    """
+    pathspecs = ['*.py'] + [f'*{ext}' for ext in DATA_EXTENSIONS]
+    
+    try:
+        result = subprocess.run(
+            ['git', '-C', os.fspath(directory), 'ls-files', '-z', '--', *pathspecs],
+            capture_output=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    files = [os.fsdecode(p) for p in result.stdout.split(b'\0') if p]
+    return files or None
+
+
+def collect_files(directory: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Split the tree into Python sources and bundled data files, so the analyzers
+    below don't each repeat the traversal.
+    
+    Inside a git work tree the tracked files are taken from the index, which
+    avoids listing build artifacts and virtualenvs at all. Untracked files are
+    not analyzed in that case. Outside git the tree is walked.
+    """
+    py_files = []
+    data_files = []
+    
+    tracked = _git_files(directory)
+    if tracked is not None:
+        for relative in tracked:
+            # git always reports paths with forward slashes
+            *parents, name = relative.split('/')
+            if any(part in EXCLUDED_DIRS for part in parents):
+                continue
+            if name.endswith('.py'):
+                py_files.append(Path(directory, relative))
+            else:
+                data_files.append(Path(directory, relative))
+        return py_files, data_files
+    
+    pending = [os.fspath(directory)]
+    
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                # DirEntry type checks use the d_type from the directory listing,
+                # so no per-entry stat() is needed
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune excluded trees so they are never listed at all
+                    if entry.name not in EXCLUDED_DIRS:
+                        pending.append(entry.path)
+                elif not entry.is_file(follow_symlinks=False):
+                    continue
+                elif entry.name.endswith('.py'):
+                    py_files.append(Path(entry.path))
+                elif entry.name.endswith(DATA_EXTENSIONS):
+                    data_files.append(Path(entry.path))
+    
+    return py_files, data_files
+
+
+def _map_files(func, paths: list[Path], io_bound: bool = False) -> list:
+    """
+    Run func over every path in a worker pool.
+    
+    CPU-bound work (the pattern sweep) goes to a process pool to use all cores.
+    I/O-bound work (the import header reads) goes to a thread pool sized at a
+    few threads per core, so open/read syscalls overlap while the GIL is released.
+    """
+    paths = [os.fspath(p) for p in paths]
+    cpus = os.cpu_count() or 1
+    
+    if len(paths) < 2:
+        return [func(p) for p in paths]
+    
+    if io_bound:
+        with ThreadPoolExecutor(max_workers=min(32, cpus * 4)) as pool:
+            return list(pool.map(func, paths))
+    
+    if cpus == 1:
+        return [func(p) for p in paths]
+    
+    chunksize = max(1, len(paths) // (cpus * 4))
+    with ProcessPoolExecutor(max_workers=cpus) as pool:
+        return list(pool.map(func, paths, chunksize=chunksize))
+
+
+def _find_matches(content) -> list[tuple[int, int]]:
+    """Return (pattern index, start offset) for every pattern hit in content"""
+    if _HYPERSCAN_DB is None:
+        return [(m.lastindex - 1, m.start()) for m in _PATH_RE.finditer(content)]
+    
+    matches = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        matches.append((pattern_id, start))
+    
+    # The binding only accepts bytes, so the mapping is copied once here
+    _HYPERSCAN_DB.scan(content[:], match_event_handler=on_match)
+    return matches
+
+
+def _scan_one(path: str) -> tuple[str, list[Issue]]:
+    """Scan a single file for path operations (runs in a worker process)"""
+    try:
+        hits = {}
+        
+        with open(path, 'rb') as f:
+            # mmap refuses empty files, and there is nothing to scan in them anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                return path, []
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                matches = _find_matches(content)
+                # Most files have no hits, skip building the line index for them
+                if not matches:
+                    return path, []
+                
+                # Offsets of every newline, so a match position maps to its line via bisect
+                newlines = array('q', [m.start() for m in _NEWLINE_RE.finditer(content)])
+                
+                for index, start in matches:
+                    line_idx = bisect_right(newlines, start)
+                    # Report each pattern at most once per line
+                    if (index, line_idx) in hits:
+                        continue
+                    line_start = newlines[line_idx - 1] + 1 if line_idx else 0
+                    line_end = newlines[line_idx] if line_idx < len(newlines) else len(content)
+                    # Only matched lines are ever decoded to str
+                    hits[index, line_idx] = content[line_start:line_end].decode('utf-8', 'ignore')
+        
+        return path, [
+            Issue(line_idx + 1, _PATTERN_NAMES[index], line.strip())
+            for (index, line_idx), line in sorted(hits.items())
+        ]
+        
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return path, []
+
+
+def _imports_one(path: str) -> set[str]:
+    """
+    Collect the top-level modules imported by a single file.
+    Only the module header is read: scanning stops at the first top-level
+    def/class/decorator, and never reads past IMPORT_PEEK_SIZE characters.
+    """
+    imports = set()
+    
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            head = f.read(IMPORT_PEEK_SIZE)
+    except Exception:
+        return imports
+    
+    lines = head.split('\n')
+    if len(head) == IMPORT_PEEK_SIZE:
+        # The last line was probably cut in half by the read
+        lines.pop()
+    
+    paren_depth = 0
+    for line in lines:
+        # Inside a parenthesised "from x import (a, b)" list
+        if paren_depth:
+            paren_depth += line.count('(') - line.count(')')
+            continue
+        
+        if line.startswith(CODE_STARTS):
+            break
+        
+        # Cheap prefix test first, almost no line is an import statement
+        stripped = line.lstrip()
+        if not stripped.startswith(('import ', 'from ')):
+            continue
+        # Skip backslash continuations, the module name may not be complete
+        if stripped.rstrip().endswith('\\'):
+            continue
+        
+        paren_depth = max(stripped.count('(') - stripped.count(')'), 0)
+        parts = stripped.split(maxsplit=2)
+        if len(parts) < 2:
+            continue
+        
+        # Get top-level module ("a.b" -> "a", "a, b" -> "a"); relative imports yield ""
+        top_module = parts[1].partition('.')[0].partition(',')[0]
+        if top_module:
+            imports.add(top_module)
+    
+    return imports
+
+
+def find_path_usages(directory: Path, py_files: list[Path] | None = None) -> dict[str, list[Issue]]:
     """
     Scan Python files for path-related operations.
     
     Returns:
         Dictionary mapping file paths to list of found issues
     """
+    if py_files is None:
+        py_files, _ = collect_files(directory)
+    
     issues = {}
     
-    # Patterns to search for
-    patterns = {
-        '__file__': r'__file__',
-        'os.getcwd()': r'os\.getcwd\(\)',
-        'os.path.dirname': r'os\.path\.dirname',
-        'os.path.abspath': r'os\.path\.abspath',
-        'os.path.join': r'os\.path\.join',
-        'open(': r'\bopen\s*\(',
-        'Path(': r'\bPath\s*\(',
-        'pkg_resources': r'pkg_resources',
-        'importlib.resources': r'importlib\.resources',
-    }
-    
-    for py_file in directory.rglob('*.py'):
-        # Skip __pycache__ and venv
-        if '__pycache__' in str(py_file) or 'venv' in str(py_file):
-            continue
-        
-        try:
-            with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
-            
-            file_issues = []
-            
-            for pattern_name, pattern in patterns.items():
-                for i, line in enumerate(lines, 1):
-                    if re.search(pattern, line):
-                        file_issues.append({
-                            'line': i,
-                            'pattern': pattern_name,
-                            'content': line.strip()
-                        })
-            
-            if file_issues:
-                relative_path = py_file.relative_to(directory)
-                issues[str(relative_path)] = file_issues
-                
-        except Exception as e:
-            print(f"Error reading {py_file}: {e}")
+    for path, file_issues in _map_files(_scan_one, py_files):
+        if file_issues:
+            relative_path = Path(path).relative_to(directory)
+            issues[str(relative_path)] = file_issues
     
     return issues
 
 
-def find_data_files(directory: Path) -> List[Path]:
+def find_data_files(directory: Path, data_files: list[Path] | None = None) -> list[Path]:
     """
     Find non-Python files that may need to be bundled.
     """
-    data_extensions = {'.txt', '.yaml', '.yml', '.json', '.xml', '.conf', '.cfg', '.ini'}
-    data_files = []
+    if data_files is None:
+        _, data_files = collect_files(directory)
     
-    for file in directory.rglob('*'):
-        if file.is_file() and file.suffix in data_extensions:
-            if '__pycache__' not in str(file) and 'venv' not in str(file):
-                data_files.append(file.relative_to(directory))
-    
-    return data_files
+    return [file.relative_to(directory) for file in data_files]
 
 
-def analyze_imports(directory: Path) -> Set[str]:
+def analyze_imports(directory: Path, py_files: list[Path] | None = None) -> set[str]:
     """
     Find all imported modules to understand dependencies.
     """
-    imports = set()
-    import_pattern = r'^\s*(?:from\s+([\w.]+)|import\s+([\w.]+))'
+    if py_files is None:
+        py_files, _ = collect_files(directory)
     
-    for py_file in directory.rglob('*.py'):
-        if '__pycache__' in str(py_file) or 'venv' in str(py_file):
-            continue
-        
-        try:
-            with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    match = re.match(import_pattern, line)
-                    if match:
-                        module = match.group(1) or match.group(2)
-                        if module:
-                            # Get top-level module
-                            top_module = module.split('.')[0]
-                            imports.add(top_module)
-        except Exception:
-            pass
+    imports = set()
+    for file_imports in _map_files(_imports_one, py_files, io_bound=True):
+        imports |= file_imports
     
     return imports
 
@@ -112,9 +326,12 @@ def print_analysis(nxc_path: Path):
     print("=" * 80)
     print()
     
+    # Walk the tree once and share the file lists between all analyzers
+    py_files, data_files = collect_files(nxc_path)
+    
     # Find path usages
     print("🔍 Scanning for path-dependent code...")
-    issues = find_path_usages(nxc_path)
+    issues = find_path_usages(nxc_path, py_files)
     
     print(f"\n📊 Found {len(issues)} files with path operations\n")
     
@@ -130,13 +347,22 @@ def print_analysis(nxc_path: Path):
     print("🚨 CRITICAL FILES TO PATCH:")
     print("-" * 80)
     
+    # Index the reported files by their trailing one and two path segments,
+    # so each critical file is a dict lookup rather than a scan over all keys
+    by_suffix = {}
+    for key in issues:
+        parts = key.replace(os.sep, '/').split('/')
+        by_suffix.setdefault(parts[-1], []).append(key)
+        if len(parts) > 1:
+            by_suffix.setdefault('/'.join(parts[-2:]), []).append(key)
+    
     for file in critical_files:
-        matching_files = [k for k in issues.keys() if file in k]
+        matching_files = by_suffix.get(file, [])
         if matching_files:
             for matched_file in matching_files:
                 print(f"\n📄 {matched_file}")
                 for issue in issues[matched_file][:5]:  # Show first 5 issues
-                    print(f"   Line {issue['line']:4d} | {issue['pattern']:20s} | {issue['content'][:60]}")
+                    print(f"   Line {issue.line:4d} | {issue.pattern:20s} | {issue.content[:60]}")
                 if len(issues[matched_file]) > 5:
                     print(f"   ... and {len(issues[matched_file]) - 5} more")
         else:
@@ -145,7 +371,7 @@ def print_analysis(nxc_path: Path):
     # Data files
     print("\n\n📦 DATA FILES TO BUNDLE:")
     print("-" * 80)
-    data_files = find_data_files(nxc_path)
+    data_files = find_data_files(nxc_path, data_files)
     
     if data_files:
         for df in sorted(data_files)[:20]:  # Show first 20
@@ -158,7 +384,7 @@ def print_analysis(nxc_path: Path):
     # Imports
     print("\n\n📚 EXTERNAL DEPENDENCIES:")
     print("-" * 80)
-    imports = analyze_imports(nxc_path)
+    imports = analyze_imports(nxc_path, py_files)
     
     # Filter to likely external packages (not stdlib)
     stdlib = {'os', 'sys', 're', 'json', 'pathlib', 'logging', 'argparse', 
@@ -6,10 +6,28 @@ Compiles NetExec into a single-file Windows executable.
 import subprocess
 import sys
 import os
+import threading
+import importlib.util
+from importlib import metadata
 from pathlib import Path
 import shutil
 
 
+def _count_py_files(directory):
+    """Count .py files directly inside directory, using dirent types instead of stat()"""
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries if e.name.endswith('.py') and e.is_file(follow_symlinks=False))
+
+
+def _count_data_files(directory):
+    """Count files with an extension anywhere below directory, skipping __pycache__"""
+    count = 0
+    for _root, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [d for d in dirnames if d != '__pycache__']
+        count += sum(1 for name in filenames if '.' in name)
+    return count
+
+
 class NuitkaBuilder:
     """Handles the Nuitka compilation process"""
     
@@ -39,31 +57,30 @@ class NuitkaBuilder:
         
         # Check Nuitka
         print("\n[2/6] Nuitka Installation...")
+        # Resolved in-process, spawning `python -m nuitka --version` costs a full interpreter start
         try:
-            result = subprocess.run([sys.executable, '-m', 'nuitka', '--version'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0]  # Get first line
-                print(f"  ✓ Nuitka installed: {version}")
-                checks['nuitka'] = True
-            else:
-                print(f"  ✗ Nuitka not working (return code: {result.returncode})")
-                if result.stderr:
-                    print(f"    Error: {result.stderr.strip()}")
-                checks['nuitka'] = False
+            if importlib.util.find_spec('nuitka') is None:
+                raise metadata.PackageNotFoundError('nuitka')
+            # A vendored or source-tree nuitka imports fine but has no metadata
+            version = metadata.version('nuitka')
+            print(f"  ✓ Nuitka installed: {version}")
+            checks['nuitka'] = True
+        except metadata.PackageNotFoundError:
+            print("  ✗ Nuitka not installed")
+            print("  Install with: pip install nuitka")
+            checks['nuitka'] = False
         except Exception as e:
-            print(f"  ✗ Nuitka not installed: {e}")
-            print(f"  Install with: pip install nuitka")
+            print(f"  ✗ Nuitka not working: {e}")
+            print("  Install with: pip install nuitka")
             checks['nuitka'] = False
         
         # Check MSVC (required for Nuitka on Windows)
         print("\n[3/6] MSVC Compiler...")
         try:
             # Try to find cl.exe
-            result = subprocess.run(['where', 'cl.exe'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print(f"  ✓ MSVC found: {result.stdout.strip()}")
+            cl_path = shutil.which('cl.exe')
+            if cl_path:
+                print(f"  ✓ MSVC found: {cl_path}")
                 checks['msvc'] = True
             else:
                 print(f"  ⚠ MSVC not in PATH")
@@ -86,8 +103,10 @@ class NuitkaBuilder:
         # Check nxc directory
         print("\n[5/6] NetExec Package...")
         if self.nxc_path.exists():
-            protocol_count = len(list((self.nxc_path / 'protocols').glob('*.py'))) if (self.nxc_path / 'protocols').exists() else 0
-            module_count = len(list((self.nxc_path / 'modules').glob('*.py'))) if (self.nxc_path / 'modules').exists() else 0
+            protocols_dir = self.nxc_path / 'protocols'
+            modules_dir = self.nxc_path / 'modules'
+            protocol_count = _count_py_files(protocols_dir) if protocols_dir.is_dir() else 0
+            module_count = _count_py_files(modules_dir) if modules_dir.is_dir() else 0
             print(f"  ✓ nxc package found")
             print(f"    Protocols: {protocol_count}")
             print(f"    Modules: {module_count}")
@@ -100,8 +119,8 @@ class NuitkaBuilder:
         print("\n[6/6] Data Files...")
         data_path = self.nxc_path / 'data'
         if data_path.exists():
-            data_files = list(data_path.rglob('*.*'))
-            print(f"  ✓ Data directory found: {len(data_files)} files")
+            data_count = _count_data_files(data_path)
+            print(f"  ✓ Data directory found: {data_count} files")
             checks['data'] = True
         else:
             print(f"  ⚠ Data directory not found (may not be critical)")
@@ -249,6 +268,42 @@ class NuitkaBuilder:
             print(f"\n✗ Build error: {e}")
             return False
     
+    def _run_exe(self, exe_path, args, markers=(), stop_marker=None, timeout=60):
+        """
+        Run the compiled exe, streaming stdout line by line rather than buffering it.
+        
+        Returns (returncode, first output line, markers seen). When stop_marker is
+        seen the process is terminated right away instead of waiting for it to exit.
+        Raises subprocess.TimeoutExpired if the exe runs longer than timeout seconds.
+        """
+        found = set()
+        first_line = ''
+        timed_out = []
+        
+        with subprocess.Popen([str(exe_path)] + args, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True) as proc:
+            def kill():
+                timed_out.append(True)
+                proc.kill()
+            
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    if not first_line and line.strip():
+                        first_line = line.strip()
+                    found.update(m for m in markers if m in line)
+                    if stop_marker in found:
+                        proc.terminate()
+                        break
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return returncode, first_line, found
+    
     def test_exe(self):
         """Test the compiled executable"""
         exe_path = self.output_dir / 'netexec.exe'
@@ -272,30 +327,32 @@ class NuitkaBuilder:
             print(f"Command: netexec.exe {' '.join(args)}")
             
             try:
-                result = subprocess.run(
-                    [str(exe_path)] + args,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
                 if args == []:  # Self-test
+                    # Stop the exe as soon as it reports success instead of waiting for it to exit
+                    returncode, _, found = self._run_exe(
+                        exe_path, args,
+                        markers=('Comprehensive Self-Test', 'Self-test PASSED'),
+                        stop_marker='Self-test PASSED'
+                    )
                     # Check for comprehensive test
-                    if 'Comprehensive Self-Test' in result.stdout:
+                    if 'Comprehensive Self-Test' in found:
                         print(f"  ✓ Self-test runs")
-                        if 'Self-test PASSED' in result.stdout or result.returncode == 0:
+                        if 'Self-test PASSED' in found or returncode == 0:
                             print(f"  ✓ Self-test PASSED")
                         else:
                             print(f"  ⚠ Self-test completed with warnings")
                     else:
                         print(f"  ⚠ Self-test output unclear")
-                elif result.returncode in [0, 1]:  # Version returns 1, help returns 0
+                    continue
+                
+                returncode, first_line, _ = self._run_exe(exe_path, args)
+                if returncode in [0, 1]:  # Version returns 1, help returns 0
                     print(f"  ✓ {description} works")
                     if args == ['--version']:
-                        print(f"    Output: {result.stdout.strip()}")
+                        print(f"    Output: {first_line}")
                 else:
                     print(f"  ✗ {description} failed")
-                    print(f"    Return code: {result.returncode}")
+                    print(f"    Return code: {returncode}")
                     
             except subprocess.TimeoutExpired:
                 print(f"  ✗ {description} timed out")
@@ -0,0 +1,10 @@
+"""Shared pytest fixtures for the top-level validation scripts."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def selftest():
+    """The `run_netexec.py` self-test run, shared by every test in a session"""
+    from test_self_test import _run_selftest
+    return _run_selftest()
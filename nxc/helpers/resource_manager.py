@@ -6,111 +6,110 @@ Compatible with Nuitka single-file builds.
 
 import os
 import sys
-from pathlib import Path
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
+def _find_base_path() -> str:
+    """
+    Find the base path for NetExec resources.
+    Works in both development and compiled modes.
+    """
+    # Check if running as a Nuitka compiled binary
+    if getattr(sys, 'frozen', False):
+        # Running as compiled binary
+        if hasattr(sys, '_MEIPASS'):
+            # PyInstaller/Nuitka onefile mode
+            return os.fspath(sys._MEIPASS)
+        else:
+            # Nuitka standalone mode
+            return os.path.dirname(sys.executable)
+    else:
+        # Running in development mode
+        # Find the nxc package directory
+        try:
+            import nxc
+            return os.path.dirname(os.path.dirname(nxc.__file__))
+        except (ImportError, AttributeError, TypeError):
+            # Fallback: assume we're in the repo root
+            return os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+@cache
+def _ensure_dir_once(path: str) -> str:
+    """Create path on first request only, later calls make no syscalls"""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(nxc_path: str, relative_path: str) -> str:
+    """Join relative_path onto nxc_path, cached without holding on to any ResourceManager"""
+    return os.path.join(nxc_path, relative_path)
+
+
+# Resolved once at import, the layout does not change while the process runs.
+# Paths are kept as plain strings, callers needing pathlib can wrap them in Path().
+IS_FROZEN = getattr(sys, 'frozen', False)
+BASE_PATH = _find_base_path()
+NXC_PATH = os.path.join(BASE_PATH, 'nxc')
+PROTOCOLS_PATH = os.path.join(NXC_PATH, 'protocols')
+MODULES_PATH = os.path.join(NXC_PATH, 'modules')
+DATA_PATH = os.path.join(NXC_PATH, 'data')
+# Writable database location: the user's home when frozen, the repo workspace otherwise
+WORKSPACE_PATH = os.path.join(os.path.expanduser('~'), '.nxc') if IS_FROZEN else os.path.join(BASE_PATH, 'workspace')
+
+
+@dataclass(frozen=True)
 class ResourceManager:
     """
     Manages resource paths for NetExec to work from any directory.
     Handles both development mode and Nuitka-compiled binary mode.
     """
     
-    _instance = None
-    _base_path = None
+    base_path: str = BASE_PATH
+    nxc_path: str = NXC_PATH
+    protocols_path: str = PROTOCOLS_PATH
+    modules_path: str = MODULES_PATH
+    data_path: str = DATA_PATH
+    db_path: str = WORKSPACE_PATH
+    is_frozen: bool = IS_FROZEN
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ResourceManager, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-    
-    def _initialize(self):
-        """Initialize the base path for resources"""
-        self._base_path = self._find_base_path()
-        self._is_frozen = getattr(sys, 'frozen', False)
-    
-    def _find_base_path(self) -> Path:
-        """
-        Find the base path for NetExec resources.
-        Works in both development and compiled modes.
-        """
-        # Check if running as a Nuitka compiled binary
-        if getattr(sys, 'frozen', False):
-            # Running as compiled binary
-            if hasattr(sys, '_MEIPASS'):
-                # PyInstaller/Nuitka onefile mode
-                return Path(sys._MEIPASS)
-            else:
-                # Nuitka standalone mode
-                return Path(sys.executable).parent
-        else:
-            # Running in development mode
-            # Find the nxc package directory
-            try:
-                import nxc
-                return Path(nxc.__file__).parent.parent
-            except (ImportError, AttributeError):
-                # Fallback: assume we're in the repo root
-                return Path(__file__).parent.parent.parent
-    
-    @property
-    def base_path(self) -> Path:
-        """Get the base path for the application"""
-        return self._base_path
-    
-    @property
-    def nxc_path(self) -> Path:
-        """Get the nxc package path"""
-        return self._base_path / 'nxc'
-    
-    @property
-    def is_frozen(self) -> bool:
-        """Check if running as compiled binary"""
-        return self._is_frozen
-    
-    def get_protocols_path(self) -> Path:
+    def get_protocols_path(self) -> str:
         """Get the path to protocols directory"""
-        return self.nxc_path / 'protocols'
+        return self.protocols_path
     
-    def get_modules_path(self) -> Path:
+    def get_modules_path(self) -> str:
         """Get the path to modules directory"""
-        return self.nxc_path / 'modules'
+        return self.modules_path
     
-    def get_data_path(self) -> Path:
+    def get_data_path(self) -> str:
         """Get the path to data directory"""
-        return self.nxc_path / 'data'
+        return self.data_path
     
-    def get_db_path(self) -> Path:
+    def get_db_path(self) -> str:
         """
         Get the database path.
         In frozen mode, use user's home directory to allow writes.
         """
-        if self.is_frozen:
-            # Use user's home directory for database
-            home = Path.home()
-            db_dir = home / '.nxc'
-            db_dir.mkdir(parents=True, exist_ok=True)
-            return db_dir
-        else:
-            # Development mode: use workspace directory
-            workspace = self.base_path / 'workspace'
-            workspace.mkdir(parents=True, exist_ok=True)
-            return workspace
+        return _ensure_dir_once(self.db_path)
     
-    def resolve_path(self, relative_path: str) -> Path:
+    def resolve_path(self, relative_path: str) -> str:
         """
         Resolve a relative path to an absolute path based on base_path.
+        Loaders ask for the same relative paths repeatedly, so results are cached.
         
         Args:
             relative_path: Path relative to the nxc package
             
         Returns:
-            Absolute Path object
+            Absolute path string
         """
-        return self.nxc_path / relative_path
+        return _resolve_path(self.nxc_path, relative_path)
     
-    def ensure_directory(self, path: Path) -> Path:
+    def ensure_directory(self, path: str) -> str:
         """
         Ensure a directory exists, create if it doesn't.
         
@@ -120,23 +119,20 @@ class ResourceManager:
         Returns:
             The path (for chaining)
         """
-        path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
         return path
 
 
 # Global instance
-_resource_manager = None
+_resource_manager = ResourceManager()
 
 
 def get_resource_manager() -> ResourceManager:
     """Get the global ResourceManager instance"""
-    global _resource_manager
-    if _resource_manager is None:
-        _resource_manager = ResourceManager()
     return _resource_manager
 
 
-def get_data_path(filename: str = '') -> Path:
+def get_data_path(filename: str = '') -> str:
     """
     Convenience function to get a path in the data directory.
     
@@ -146,15 +142,12 @@ def get_data_path(filename: str = '') -> Path:
     Returns:
         Path to data directory or file
     """
-    rm = get_resource_manager()
-    data_path = rm.get_data_path()
-    
     if filename:
-        return data_path / filename
-    return data_path
+        return os.path.join(DATA_PATH, filename)
+    return DATA_PATH
 
 
-def get_workspace_path(filename: str = '') -> Path:
+def get_workspace_path(filename: str = '') -> str:
     """
     Convenience function to get a path in the workspace directory.
     
@@ -164,9 +157,8 @@ def get_workspace_path(filename: str = '') -> Path:
     Returns:
         Path to workspace directory or file
     """
-    rm = get_resource_manager()
-    workspace = rm.get_db_path()
+    workspace = _resource_manager.get_db_path()
     
     if filename:
-        return workspace / filename
+        return os.path.join(workspace, filename)
     return workspace
\ No newline at end of file
@@ -5,8 +5,12 @@ Provides comprehensive validation of all components when exe is launched without
 
 import sys
 import os
+import re
+import subprocess
+from collections import defaultdict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,311 +23,469 @@ class TestStatus(Enum):
     SKIP = "[SKIP]"
 
 
-@dataclass
+# Plain-string forms for the console lines, saves the enum lookup per print
+_PASS, _FAIL, _WARN, _SKIP = (s.value for s in (TestStatus.PASS, TestStatus.FAIL, TestStatus.WARN, TestStatus.SKIP))
+
+
+@dataclass(slots=True)
 class TestResult:
     """Individual test result"""
     name: str
     status: TestStatus
     message: str = ""
-    details: List[str] = None
+    details: list[str] = None
     
     def __post_init__(self):
         if self.details is None:
             self.details = []
 
 
+_MODULE_RE = re.compile(r'module(s)?', re.IGNORECASE)
+
+
+def _count_files(directory) -> tuple[int, set[str]]:
+    """
+    Count regular files below directory without building the listing.
+    Also returns the names of the files directly in directory, collected
+    during the same walk.
+    """
+    count = 0
+    top_level = set()
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    count += 1
+                    if current is directory:
+                        top_level.add(entry.name)
+    return count, top_level
+
+
+class SubprocessRunner:
+    """
+    run_netexec() stand-in that runs each command in a fresh NetExec process.
+    
+    Slower per call than the in-process run_netexec(), but isolated: protocols
+    that call os._exit() can't take the runner down, and calls may overlap.
+    """
+    
+    def __init__(self, command: list[str], timeout: int = 120):
+        """
+        Args:
+            command: Argument prefix that launches NetExec (exe, or interpreter + script)
+            timeout: Seconds before a single run is killed
+        """
+        self.command = list(command)
+        self.timeout = timeout
+    
+    def __call__(self, args: list[str]) -> dict:
+        try:
+            proc = subprocess.run(
+                self.command + list(args),
+                capture_output=True,
+                text=True,
+                errors='replace',
+                timeout=self.timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"returncode": 1, "stdout": "", "stderr": f"Timed out after {self.timeout}s", "parsed": {}}
+        except OSError as e:
+            return {"returncode": 1, "stdout": "", "stderr": f"Could not start NetExec: {e}", "parsed": {}}
+        
+        return {"returncode": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr, "parsed": {}}
+
+
 class SelfTestRunner:
     """Comprehensive self-test runner for NetExec"""
     
-    def __init__(self, run_netexec_func):
+    def __init__(self, run_netexec_func, max_workers: int = 1):
         """
         Initialize self-test runner.
         
         Args:
             run_netexec_func: The run_netexec() function to execute tests
+            max_workers: Concurrent run_netexec() calls for independent probes.
+                Keep at 1 unless run_netexec_func is thread-safe; the in-process
+                runner swaps the global sys.argv/sys.stdout.
         """
         self.run_netexec = run_netexec_func
-        self.results: List[TestResult] = []
+        self.max_workers = max(1, max_workers)
+        self.results: list[TestResult] = []
         self.protocols = ['ftp', 'ldap', 'mssql', 'nfs', 'rdp', 'smb', 'ssh', 'vnc', 'winrm', 'wmi']
-        
-    def _add_result(self, name: str, status: TestStatus, message: str = "", details: List[str] = None):
-        """Add a test result"""
-        self.results.append(TestResult(name, status, message, details or []))
+        self._run_cache: dict[tuple[str, ...], dict] = {}
+        
+    def _run_cached(self, args: tuple[str, ...]) -> dict:
+        """Run NetExec once per distinct argument tuple and reuse the result"""
+        result = self._run_cache.get(args)
+        if result is None:
+            result = self.run_netexec(list(args))
+            self._run_cache[args] = result
+        return result
     
-    def test_basic_functionality(self) -> None:
+    @staticmethod
+    def _add_result(results: list[TestResult], name: str, status: TestStatus, message: str = "", details: list[str] = None):
+        """Add a test result to a suite's result list"""
+        results.append(TestResult(name, status, message, details or []))
+    
+    def test_basic_functionality(self) -> tuple[list[TestResult], list[str]]:
         """Test 1: Basic command-line functionality"""
-        print("\n[TEST 1] Basic Functionality")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 1] Basic Functionality")
+        log("-" * 60)
         
         # Test version
-        print("  Testing --version...")
+        log("  Testing --version...")
         result = self.run_netexec(['--version'])
         if len(result['stdout']) > 0 and 'Yippie-Ki-Yay' in result['stdout']:
             version = result['stdout'].strip()
             self._add_result(
+                results,
                 "basic_version",
                 TestStatus.PASS,
                 f"Version: {version}"
             )
-            print(f"    {TestStatus.PASS.value}: {version}")
+            log(f"    {_PASS}: {version}")
         else:
-            self._add_result("basic_version", TestStatus.FAIL, "Version output invalid")
-            print(f"    {TestStatus.FAIL.value}: No version output")
+            self._add_result(results, "basic_version", TestStatus.FAIL, "Version output invalid")
+            log(f"    {_FAIL}: No version output")
         
         # Test help
-        print("  Testing --help...")
-        result = self.run_netexec(['--help'])
+        log("  Testing --help...")
+        result = self._run_cached(('--help',))
         if result['returncode'] == 0 and 'usage:' in result['stdout'].lower():
-            self._add_result("basic_help", TestStatus.PASS, "Help menu accessible")
-            print(f"    {TestStatus.PASS.value}: Help menu works")
+            self._add_result(results, "basic_help", TestStatus.PASS, "Help menu accessible")
+            log(f"    {_PASS}: Help menu works")
         else:
-            self._add_result("basic_help", TestStatus.FAIL, "Help menu failed")
-            print(f"    {TestStatus.FAIL.value}: Help menu error")
+            self._add_result(results, "basic_help", TestStatus.FAIL, "Help menu failed")
+            log(f"    {_FAIL}: Help menu error")
+        
+        return results, lines
     
-    def test_protocol_availability(self) -> None:
+    def test_protocol_availability(self) -> tuple[list[TestResult], list[str]]:
         """Test 2: All protocols are available"""
-        print("\n[TEST 2] Protocol Availability")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 2] Protocol Availability")
+        log("-" * 60)
         
         available_protocols = []
         failed_protocols = []
         
-        for protocol in self.protocols:
-            result = self.run_netexec([protocol, '--help'])
-            
+        probe_args = [[protocol, '--help'] for protocol in self.protocols]
+        if self.max_workers == 1:
+            protocol_results = list(map(self.run_netexec, probe_args))
+        else:
+            # Each probe is independent, so overlap their start-up cost;
+            # map keeps the results in protocol order
+            workers = min(self.max_workers, len(self.protocols))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                protocol_results = list(executor.map(self.run_netexec, probe_args))
+        
+        for protocol, result in zip(self.protocols, protocol_results, strict=True):
             # Success if help shows or returns expected codes
             if result['returncode'] in [0, 2] and len(result['stdout']) > 100:
                 available_protocols.append(protocol)
                 self._add_result(
+                    results,
                     f"protocol_{protocol}",
                     TestStatus.PASS,
                     f"{protocol.upper()} protocol available"
                 )
-                print(f"  {TestStatus.PASS.value}: {protocol.upper()}")
+                log(f"  {_PASS}: {protocol.upper()}")
             else:
                 failed_protocols.append(protocol)
                 self._add_result(
+                    results,
                     f"protocol_{protocol}",
                     TestStatus.FAIL,
                     f"{protocol.upper()} protocol unavailable"
                 )
-                print(f"  {TestStatus.FAIL.value}: {protocol.upper()}")
+                log(f"  {_FAIL}: {protocol.upper()}")
         
         # Summary
-        print(f"\n  Summary: {len(available_protocols)}/{len(self.protocols)} protocols available")
+        log(f"\n  Summary: {len(available_protocols)}/{len(self.protocols)} protocols available")
+        
+        return results, lines
     
-    def test_module_system(self) -> None:
+    def test_module_system(self) -> tuple[list[TestResult], list[str]]:
         """Test 3: Module system functionality"""
-        print("\n[TEST 3] Module System")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 3] Module System")
+        log("-" * 60)
         
         # Test module listing with SMB (most common)
-        print("  Testing module listing...")
+        log("  Testing module listing...")
         result = self.run_netexec(['smb', '-L'])
         
+        # One case-insensitive scan gives both the mention count and whether
+        # the plural "modules" appears; the group is 's' only for the plural
+        mentions = _MODULE_RE.findall(result['stdout'])
+        
         # Module listing might return various codes but should show modules
-        if 'modules' in result['stdout'].lower() or result['returncode'] in [0, 1]:
+        if any(mentions) or result['returncode'] in [0, 1]:
             # Try to count modules mentioned
-            module_mentions = result['stdout'].lower().count('module')
+            module_mentions = len(mentions)
             self._add_result(
+                results,
                 "modules_list",
                 TestStatus.PASS,
                 f"Module system functional (mentions: {module_mentions})"
             )
-            print(f"    {TestStatus.PASS.value}: Module listing works")
+            log(f"    {_PASS}: Module listing works")
         else:
             self._add_result(
+                results,
                 "modules_list",
                 TestStatus.WARN,
                 "Module listing unclear"
             )
-            print(f"    {TestStatus.WARN.value}: Module listing unclear")
+            log(f"    {_WARN}: Module listing unclear")
         
         # Test specific module help (if available)
-        print("  Testing module help...")
+        log("  Testing module help...")
         result = self.run_netexec(['smb', '-M', 'spider_plus', '--help'])
         
         if result['returncode'] in [0, 1, 2] or len(result['stdout']) > 0:
-            self._add_result("modules_help", TestStatus.PASS, "Module help accessible")
-            print(f"    {TestStatus.PASS.value}: Module help works")
+            self._add_result(results, "modules_help", TestStatus.PASS, "Module help accessible")
+            log(f"    {_PASS}: Module help works")
         else:
-            self._add_result("modules_help", TestStatus.WARN, "Module help unclear")
-            print(f"    {TestStatus.WARN.value}: Module help unclear")
+            self._add_result(results, "modules_help", TestStatus.WARN, "Module help unclear")
+            log(f"    {_WARN}: Module help unclear")
+        
+        return results, lines
     
-    def test_path_independence(self) -> None:
+    def test_path_independence(self) -> tuple[list[TestResult], list[str]]:
         """Test 4: Path independence validation"""
-        print("\n[TEST 4] Path Independence")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 4] Path Independence")
+        log("-" * 60)
         
         try:
             from nxc.helpers.resource_manager import get_resource_manager
             
             rm = get_resource_manager()
             
-            # Check base paths
+            # Read each path once and reuse it for both the checks and the report
+            base_path = rm.base_path
+            nxc_path = rm.nxc_path
+            protocols_path = rm.get_protocols_path()
+            modules_path = rm.get_modules_path()
+            db_path = rm.get_db_path()
+            is_frozen = rm.is_frozen
+            
+            # Check base paths, one stat() per path at most. A directory that
+            # exists implies its parents do, so those checks are short-circuited.
+            if is_frozen:
+                protocols_ok = modules_ok = nxc_ok = True
+                base_ok = os.path.exists(base_path)
+            else:
+                protocols_ok = os.path.exists(protocols_path)
+                modules_ok = os.path.exists(modules_path)
+                nxc_ok = protocols_ok or modules_ok or os.path.exists(nxc_path)
+                base_ok = nxc_ok or os.path.exists(base_path)
+            
             checks = {
-                'base_path': rm.base_path.exists(),
-                'nxc_path': rm.nxc_path.exists() if not rm.is_frozen else True,
-                'protocols_path': rm.get_protocols_path().exists() if not rm.is_frozen else True,
-                'modules_path': rm.get_modules_path().exists() if not rm.is_frozen else True,
-                'db_path': rm.get_db_path().exists(),
+                'base_path': base_ok,
+                'nxc_path': nxc_ok,
+                'protocols_path': protocols_ok,
+                'modules_path': modules_ok,
+                'db_path': os.path.exists(db_path),
             }
             
             all_pass = all(checks.values())
             
-            print(f"  Base path: {rm.base_path}")
-            print(f"    Exists: {checks['base_path']}")
+            log(f"  Base path: {base_path}")
+            log(f"    Exists: {checks['base_path']}")
             
-            if not rm.is_frozen:
-                print(f"  NXC path: {rm.nxc_path}")
-                print(f"    Exists: {checks['nxc_path']}")
-                print(f"  Protocols path: {rm.get_protocols_path()}")
-                print(f"    Exists: {checks['protocols_path']}")
-                print(f"  Modules path: {rm.get_modules_path()}")
-                print(f"    Exists: {checks['modules_path']}")
+            if not is_frozen:
+                log(f"  NXC path: {nxc_path}")
+                log(f"    Exists: {checks['nxc_path']}")
+                log(f"  Protocols path: {protocols_path}")
+                log(f"    Exists: {checks['protocols_path']}")
+                log(f"  Modules path: {modules_path}")
+                log(f"    Exists: {checks['modules_path']}")
             
-            print(f"  Database path: {rm.get_db_path()}")
-            print(f"    Exists: {checks['db_path']}")
+            log(f"  Database path: {db_path}")
+            log(f"    Exists: {checks['db_path']}")
             
             if all_pass:
                 self._add_result(
+                    results,
                     "path_independence",
                     TestStatus.PASS,
                     "All paths accessible",
                     [f"{k}: {v}" for k, v in checks.items()]
                 )
-                print(f"\n  {TestStatus.PASS.value}: All paths valid")
+                log(f"\n  {_PASS}: All paths valid")
             else:
                 failed = [k for k, v in checks.items() if not v]
                 self._add_result(
+                    results,
                     "path_independence",
                     TestStatus.FAIL,
                     f"Some paths failed: {failed}",
                     [f"{k}: {v}" for k, v in checks.items()]
                 )
-                print(f"\n  {TestStatus.FAIL.value}: Some paths invalid: {failed}")
+                log(f"\n  {_FAIL}: Some paths invalid: {failed}")
                 
         except Exception as e:
             self._add_result(
+                results,
                 "path_independence",
                 TestStatus.FAIL,
                 f"ResourceManager error: {str(e)}"
             )
-            print(f"  {TestStatus.FAIL.value}: {str(e)}")
+            log(f"  {_FAIL}: {str(e)}")
+        
+        return results, lines
     
-    def test_database_functionality(self) -> None:
+    def test_database_functionality(self) -> tuple[list[TestResult], list[str]]:
         """Test 5: Database initialization and access"""
-        print("\n[TEST 5] Database Functionality")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 5] Database Functionality")
+        log("-" * 60)
         
         db_path = os.environ.get('NXC_DB', '')
         
         if db_path:
             db_path_obj = Path(db_path)
             
-            print(f"  Database location: {db_path}")
+            log(f"  Database location: {db_path}")
             
             # Check if directory exists
             if db_path_obj.exists():
-                print(f"    {TestStatus.PASS.value}: Directory exists")
+                log(f"    {_PASS}: Directory exists")
                 
                 # Check if writable
                 try:
                     test_file = db_path_obj / '.write_test'
-                    test_file.write_text('test')
-                    test_file.unlink()
+                    try:
+                        # An empty write is enough to prove permission
+                        test_file.write_bytes(b'')
+                    finally:
+                        test_file.unlink(missing_ok=True)
                     
                     self._add_result(
+                        results,
                         "database_writable",
                         TestStatus.PASS,
                         f"Database path writable: {db_path}"
                     )
-                    print(f"    {TestStatus.PASS.value}: Directory writable")
+                    log(f"    {_PASS}: Directory writable")
                     
-                except Exception as e:
+                except OSError as e:
                     self._add_result(
+                        results,
                         "database_writable",
                         TestStatus.FAIL,
                         f"Database path not writable: {str(e)}"
                     )
-                    print(f"    {TestStatus.FAIL.value}: Not writable - {e}")
+                    log(f"    {_FAIL}: Not writable - {e}")
             else:
                 self._add_result(
+                    results,
                     "database_writable",
                     TestStatus.WARN,
                     "Database directory doesn't exist yet"
                 )
-                print(f"    {TestStatus.WARN.value}: Directory doesn't exist (will be created on use)")
+                log(f"    {_WARN}: Directory doesn't exist (will be created on use)")
         else:
             self._add_result(
+                results,
                 "database_writable",
                 TestStatus.FAIL,
                 "NXC_DB environment variable not set"
             )
-            print(f"  {TestStatus.FAIL.value}: NXC_DB not set")
+            log(f"  {_FAIL}: NXC_DB not set")
+        
+        return results, lines
     
-    def test_data_files(self) -> None:
+    def test_data_files(self) -> tuple[list[TestResult], list[str]]:
         """Test 6: Data files accessibility"""
-        print("\n[TEST 6] Data Files")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 6] Data Files")
+        log("-" * 60)
         
         try:
             from nxc.helpers.resource_manager import get_resource_manager
             rm = get_resource_manager()
             
-            data_path = rm.get_data_path()
+            data_path = Path(rm.get_data_path())
             
             if data_path.exists():
                 # Count data files
-                data_files = list(data_path.rglob('*'))
-                file_count = len([f for f in data_files if f.is_file()])
+                file_count, top_level = _count_files(data_path)
                 
-                print(f"  Data directory: {data_path}")
-                print(f"  Files found: {file_count}")
+                log(f"  Data directory: {data_path}")
+                log(f"  Files found: {file_count}")
                 
                 # Check for critical files
                 critical_files = ['nxc.conf', 'default.pem']
                 found_critical = []
                 
                 for cf in critical_files:
-                    if (data_path / cf).exists():
+                    if cf in top_level:
                         found_critical.append(cf)
-                        print(f"    {TestStatus.PASS.value}: {cf}")
+                        log(f"    {_PASS}: {cf}")
                     else:
-                        print(f"    {TestStatus.WARN.value}: {cf} not found")
+                        log(f"    {_WARN}: {cf} not found")
                 
                 if file_count > 0:
                     self._add_result(
+                        results,
                         "data_files",
                         TestStatus.PASS,
                         f"{file_count} data files accessible"
                     )
                 else:
                     self._add_result(
+                        results,
                         "data_files",
                         TestStatus.WARN,
                         "No data files found"
                     )
             else:
                 self._add_result(
+                    results,
                     "data_files",
                     TestStatus.WARN,
                     "Data directory not found (may be bundled differently)"
                 )
-                print(f"  {TestStatus.WARN.value}: Data directory not found")
+                log(f"  {_WARN}: Data directory not found")
                 
         except Exception as e:
             self._add_result(
+                results,
                 "data_files",
                 TestStatus.FAIL,
                 f"Data files check error: {str(e)}"
             )
-            print(f"  {TestStatus.FAIL.value}: {str(e)}")
+            log(f"  {_FAIL}: {str(e)}")
+        
+        return results, lines
     
-    def test_argument_parsing(self) -> None:
+    def test_argument_parsing(self) -> tuple[list[TestResult], list[str]]:
         """Test 7: Advanced argument parsing"""
-        print("\n[TEST 7] Argument Parsing")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 7] Argument Parsing")
+        log("-" * 60)
         
         test_cases = [
             (['smb', '127.0.0.1', '-u', 'test', '-p', 'test'], 'Basic SMB syntax'),
@@ -338,54 +500,65 @@ class SelfTestRunner:
             # Should not crash (returncode != exception)
             if result['returncode'] in [0, 1, 2] or len(result['stdout']) > 0:
                 passed += 1
-                print(f"  {TestStatus.PASS.value}: {description}")
+                log(f"  {_PASS}: {description}")
             else:
-                print(f"  {TestStatus.FAIL.value}: {description}")
+                log(f"  {_FAIL}: {description}")
         
         if passed == len(test_cases):
             self._add_result(
+                results,
                 "argument_parsing",
                 TestStatus.PASS,
                 f"All {len(test_cases)} parsing tests passed"
             )
         else:
             self._add_result(
+                results,
                 "argument_parsing",
                 TestStatus.WARN,
                 f"{passed}/{len(test_cases)} parsing tests passed"
             )
+        
+        return results, lines
     
-    def test_output_capture(self) -> None:
+    def test_output_capture(self) -> tuple[list[TestResult], list[str]]:
         """Test 8: Output capture functionality"""
-        print("\n[TEST 8] Output Capture")
-        print("-" * 60)
+        results: list[TestResult] = []
+        lines: list[str] = []
+        log = lines.append
+        log("\n[TEST 8] Output Capture")
+        log("-" * 60)
         
         # Test that output is properly captured
-        result = self.run_netexec(['--help'])
+        result = self._run_cached(('--help',))
         
         has_stdout = len(result['stdout']) > 0
         has_returncode = 'returncode' in result
         is_dict = isinstance(result, dict)
         
-        print(f"  Output is dict: {is_dict}")
-        print(f"  Has returncode: {has_returncode}")
-        print(f"  Has stdout: {has_stdout}")
-        print(f"  Stdout length: {len(result['stdout'])} chars")
+        log(f"  Output is dict: {is_dict}")
+        log(f"  Has returncode: {has_returncode}")
+        log(f"  Has stdout: {has_stdout}")
+        log(f"  Stdout length: {len(result['stdout'])} chars")
         
         if is_dict and has_returncode and has_stdout:
             self._add_result(
+                results,
                 "output_capture",
                 TestStatus.PASS,
                 "Output properly captured in dict"
             )
-            print(f"  {TestStatus.PASS.value}: Output capture working")
+            log(f"  {_PASS}: Output capture working")
         else:
             self._add_result(
+                results,
                 "output_capture",
                 TestStatus.FAIL,
                 "Output capture incomplete"
             )
-            print(f"  {TestStatus.FAIL.value}: Output capture broken")
+            log(f"  {_FAIL}: Output capture broken")
+        
+        return results, lines
     
     def run_all_tests(self) -> bool:
         """Run all self-tests and return overall success"""
@@ -394,53 +567,74 @@ class SelfTestRunner:
         print("=" * 60)
         
         # Run all test suites
-        self.test_basic_functionality()
-        self.test_protocol_availability()
-        self.test_module_system()
-        self.test_path_independence()
-        self.test_database_functionality()
-        self.test_data_files()
-        self.test_argument_parsing()
-        self.test_output_capture()
+        suites = [
+            self.test_basic_functionality,
+            self.test_protocol_availability,
+            self.test_module_system,
+            self.test_path_independence,
+            self.test_database_functionality,
+            self.test_data_files,
+            self.test_argument_parsing,
+            self.test_output_capture,
+        ]
+        
+        # Each suite buffers its console lines and they are written in one go,
+        # in suite order, so concurrent suites never interleave their output
+        suite_results = []
+        for results, lines in self._run_suites(suites):
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+            suite_results.append(results)
+        
+        self.results = list(chain.from_iterable(suite_results))
         
         # Print summary
-        self._print_summary()
+        by_status = self._tally()
+        self._print_summary(by_status)
         
         # Return overall success
         total = len(self.results)
-        passed = sum(1 for r in self.results if r.status == TestStatus.PASS)
-        failed = sum(1 for r in self.results if r.status == TestStatus.FAIL)
+        passed = len(by_status[TestStatus.PASS])
+        failed = len(by_status[TestStatus.FAIL])
         
         # Success if no failures and at least 80% pass
         return failed == 0 and passed >= (total * 0.8)
     
-    def _print_summary(self):
+    def _run_suites(self, suites):
+        """Yield each suite's (results, lines) in suite order"""
+        if self.max_workers == 1:
+            for suite in suites:
+                yield suite()
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(suites))) as executor:
+            for future in [executor.submit(suite) for suite in suites]:
+                yield future.result()
+    
+    def _tally(self) -> dict[TestStatus, list[TestResult]]:
+        """Group results by status in one pass (missing statuses read as empty)"""
+        by_status = defaultdict(list)
+        for result in self.results:
+            by_status[result.status].append(result)
+        return by_status
+    
+    def _print_summary(self, by_status: dict[TestStatus, list[TestResult]] | None = None):
         """Print test summary"""
+        if by_status is None:
+            by_status = self._tally()
+        
         print("\n" + "=" * 60)
         print("Self-Test Summary")
         print("=" * 60)
         
-        # Group by status
-        by_status = {
-            TestStatus.PASS: [],
-            TestStatus.FAIL: [],
-            TestStatus.WARN: [],
-            TestStatus.SKIP: []
-        }
-        
-        for result in self.results:
-            by_status[result.status].append(result)
-        
         # Print each group
         for status in [TestStatus.PASS, TestStatus.WARN, TestStatus.FAIL, TestStatus.SKIP]:
             results = by_status[status]
             if results:
-                print(f"\n{status.value} ({len(results)}):")
-                for r in results:
-                    msg = f"  {r.name}"
-                    if r.message:
-                        msg += f": {r.message}"
-                    print(msg)
+                # One write per status group rather than one print per result
+                lines = [f"\n{status.value} ({len(results)}):"]
+                lines.extend(f"  {r.name}: {r.message}" if r.message else f"  {r.name}" for r in results)
+                sys.stdout.write('\n'.join(lines) + '\n')
         
         # Overall stats
         total = len(self.results)
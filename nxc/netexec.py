@@ -75,14 +75,13 @@ def main():
     rm = get_resource_manager()
     
     # Set database path to writable location
-    if 'NXC_DB' not in os.environ:
-        os.environ['NXC_DB'] = str(rm.get_db_path())
+    os.environ.setdefault('NXC_DB', rm.get_db_path())
     
     # Set config path
     if 'NXC_CONFIG_PATH' not in os.environ:
-        config_path = rm.get_db_path() / 'config'
-        config_path.mkdir(parents=True, exist_ok=True)
-        os.environ['NXC_CONFIG_PATH'] = str(config_path)
+        config_path = os.path.join(rm.get_db_path(), 'config')
+        os.makedirs(config_path, exist_ok=True)
+        os.environ['NXC_CONFIG_PATH'] = config_path
     
     first_run_setup(nxc_logger)
     args, version_info = gen_cli_args()
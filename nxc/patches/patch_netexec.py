@@ -3,89 +3,101 @@ Patches for NetExec module and protocol loaders to support path independence.
 Apply these patches before building with Nuitka.
 """
 
+import importlib
 import os
-import sys
 from pathlib import Path
 
+try:
+    from nxc.helpers.resource_manager import get_resource_manager
+except ImportError:
+    get_resource_manager = None
+
+# Which patches already took effect. Re-applying would wrap the patched
+# __init__ again and grow the call chain on every loader construction.
+_APPLIED = {'protocol': False, 'module': False, 'db': False, 'config': False}
+
+# Loader patches: (key, module under nxc.loaders, class, attribute, path getter, optional).
+# Each sets the attribute from the ResourceManager before the class's own __init__ runs.
+# Optional loaders may be absent from the tree and are skipped without a warning.
+PATCHES = (
+    ('protocol', 'protocol_loader', 'ProtocolLoader', 'protocols_path', lambda rm: rm.get_protocols_path(), False),
+    ('module', 'module_loader', 'ModuleLoader', 'modules_path', lambda rm: rm.get_modules_path(), True),
+)
+
 
 def patch_netexec():
     """
     Apply all necessary patches to make NetExec path-independent.
     Call this at the beginning of netexec.py's main().
     """
-    patch_protocol_loader()
-    patch_module_loader()
+    if get_resource_manager is None:
+        print("Warning: Could not patch NetExec: nxc.helpers.resource_manager not available")
+        return
+    
+    for entry in PATCHES:
+        _apply_patch(*entry)
     patch_database_path()
     patch_config_path()
 
 
-def patch_protocol_loader():
+def _apply_patch(key, module_name, class_name, attribute, getter, optional=False):
     """
-    Patch the protocol loader to use ResourceManager.
+    Point one loader class at its ResourceManager path.
     """
+    if _APPLIED[key] or get_resource_manager is None:
+        return
+    
     try:
-        from nxc.loaders.protocol_loader import ProtocolLoader
-        from nxc.helpers.resource_manager import get_resource_manager
-        
-        rm = get_resource_manager()
-        
-        # Monkey patch the protocols path
-        original_init = ProtocolLoader.__init__
+        module = importlib.import_module(f'nxc.loaders.{module_name}')
+        cls = getattr(module, class_name)
+    except (ImportError, AttributeError) as e:
+        if not optional:
+            print(f"Warning: Could not patch {key} loader: {e}")
+        return
+    
+    try:
+        value = getter(get_resource_manager())
+        original_init = cls.__init__
         
-        def patched_init(self, args, db, logger):
-            # Set the protocols path before calling original init
-            self.protocols_path = rm.get_protocols_path()
-            original_init(self, args, db, logger)
+        def patched_init(self, *args, **kwargs):
+            # Set the path before calling original init
+            setattr(self, attribute, value)
+            original_init(self, *args, **kwargs)
         
-        ProtocolLoader.__init__ = patched_init
+        cls.__init__ = patched_init
+        _APPLIED[key] = True
         
-    except ImportError as e:
-        print(f"Warning: Could not patch protocol loader: {e}")
+    except Exception as e:
+        print(f"Warning: Could not patch {key} loader: {e}")
+
+
+def patch_protocol_loader():
+    """
+    Patch the protocol loader to use ResourceManager.
+    """
+    _apply_patch(*PATCHES[0])
 
 
 def patch_module_loader():
     """
     Patch the module loader to use ResourceManager.
     """
-    try:
-        # Import after ResourceManager is available
-        from nxc.helpers.resource_manager import get_resource_manager
-        
-        rm = get_resource_manager()
-        
-        # Try to patch module loader
-        try:
-            from nxc.loaders.module_loader import ModuleLoader
-            
-            original_init = ModuleLoader.__init__
-            
-            def patched_init(self, args, db, logger):
-                # Set modules path
-                self.modules_path = rm.get_modules_path()
-                original_init(self, args, db, logger)
-            
-            ModuleLoader.__init__ = patched_init
-            
-        except ImportError:
-            pass  # Module loader might not exist or have different structure
-            
-    except Exception as e:
-        print(f"Warning: Could not patch module loader: {e}")
+    _apply_patch(*PATCHES[1])
 
 
 def patch_database_path():
     """
     Patch database initialization to use writable location.
     """
+    if _APPLIED['db'] or get_resource_manager is None:
+        return
+    
     try:
-        from nxc.helpers.resource_manager import get_resource_manager
-        
         rm = get_resource_manager()
         
         # Set NXC_DB environment variable if not set
-        if 'NXC_DB' not in os.environ:
-            db_path = rm.get_db_path()
-            os.environ['NXC_DB'] = str(db_path)
+        os.environ.setdefault('NXC_DB', rm.get_db_path())
+        _APPLIED['db'] = True
         
     except Exception as e:
         print(f"Warning: Could not patch database path: {e}")
@@ -95,16 +107,16 @@ def patch_config_path():
     """
     Patch config file paths to use writable location.
     """
+    if _APPLIED['config'] or get_resource_manager is None:
+        return
+    
     try:
-        from nxc.helpers.resource_manager import get_resource_manager
-        
-        rm = get_resource_manager()
-        
         # Set config directory in user's home
         if 'NXC_CONFIG_PATH' not in os.environ:
             config_path = Path.home() / '.nxc'
             config_path.mkdir(parents=True, exist_ok=True)
             os.environ['NXC_CONFIG_PATH'] = str(config_path)
+        _APPLIED['config'] = True
         
     except Exception as e:
         print(f"Warning: Could not patch config path: {e}")
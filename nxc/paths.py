@@ -1,15 +1,18 @@
-from os.path import join, normpath, expanduser, dirname
-from os import environ, getenv
-import nxc
-from nxc.helpers.resource_manager import get_resource_manager
+from os.path import join, normpath, expanduser
+from os import environ
 
-if "NXC_PATH" in environ:  # noqa: SIM108
-    NXC_PATH = normpath(getenv("NXC_PATH"))
-else:
-    NXC_PATH = normpath(expanduser("~/.nxc"))
+NXC_PATH = normpath(environ.get("NXC_PATH") or expanduser("~/.nxc"))
 
 TMP_PATH = join(NXC_PATH, "tmp")
 CONFIG_PATH = join(NXC_PATH, "nxc.conf")
 WORKSPACE_DIR = join(NXC_PATH, "workspaces")
-rm = get_resource_manager()
-DATA_PATH = rm.get_data_path()
+
+
+def __getattr__(name):
+    # DATA_PATH is resolved on first use so importing nxc.paths stays cheap
+    if name == "DATA_PATH":
+        from nxc.helpers.resource_manager import get_resource_manager
+
+        globals()["DATA_PATH"] = get_resource_manager().get_data_path()
+        return globals()["DATA_PATH"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
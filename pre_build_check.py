@@ -4,11 +4,90 @@ Validates that everything is ready for Nuitka compilation.
 """
 
 import sys
+import asyncio
 import subprocess
 import os
+import compileall
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
 
 
+# Paths check_repo_structure expects, relative to the repo root ('/'-separated)
+_REQUIRED_FILES = (
+    ('run_netexec.py', 'Entry point'),
+    ('nxc', 'NetExec package'),
+    ('nxc/protocols', 'Protocol modules'),
+    ('nxc/modules', 'Extension modules'),
+    ('nxc/helpers/self_test.py', 'Self-test module'),
+    ('nxc/helpers/resource_manager.py', 'Path manager'),
+)
+
+# Probe results shared between checks, so each probe runs at most once per process.
+# Subprocess runs are keyed by their argv tuple, other probes by a name.
+_probe_cache = {}
+
+
+def get_or_probe(key, probe):
+    """Return the cached result for key, running probe() to fill it on first use"""
+    result = _probe_cache.get(key)
+    if result is None:
+        result = probe()
+        _probe_cache[key] = result
+    return result
+
+
+def cached_run(argv, timeout):
+    """subprocess.run with captured text output, memoized on argv"""
+    return get_or_probe(tuple(argv), lambda: subprocess.run(
+        list(argv),
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    ))
+
+
+async def _probe(argv, timeout):
+    """Run one probe without blocking the event loop, text-decoded like cached_run"""
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    
+    def decode(data):
+        return data.decode(errors='replace').replace('\r\n', '\n')
+    
+    return subprocess.CompletedProcess(list(argv), proc.returncode, decode(out), decode(err))
+
+
+def prime_probes(probes):
+    """
+    Launch several probes at once on one event loop and seed _probe_cache.
+    A probe that fails to start or times out is left out, so cached_run()
+    repeats it and the check reports the error as usual.
+    
+    Args:
+        probes: (argv, timeout) pairs
+    """
+    async def run_all():
+        return await asyncio.gather(
+            *(_probe(argv, timeout) for argv, timeout in probes),
+            return_exceptions=True
+        )
+    
+    for (argv, _), result in zip(probes, asyncio.run(run_all()), strict=True):
+        if isinstance(result, subprocess.CompletedProcess):
+            _probe_cache[tuple(argv)] = result
+
+
 def print_section(title):
     """Print a section header"""
     print("\n" + "=" * 70)
@@ -18,138 +97,155 @@ def print_section(title):
 
 def check_python():
     """Check Python version"""
-    print("\n[CHECK 1] Python Version")
+    lines = []
+    log = lines.append
+    
+    log("\n[CHECK 1] Python Version")
     version = sys.version_info
     
-    print(f"  Python: {version.major}.{version.minor}.{version.micro}")
-    print(f"  Path: {sys.executable}")
+    log(f"  Python: {version.major}.{version.minor}.{version.micro}")
+    log(f"  Path: {sys.executable}")
     
     if version >= (3, 7):
-        print("  Status: OK (3.7+ required)")
-        return True
+        log("  Status: OK (3.7+ required)")
+        return True, lines
     else:
-        print("  Status: FAIL (need Python 3.7+)")
-        return False
+        log("  Status: FAIL (need Python 3.7+)")
+        return False, lines
 
 
 def check_nuitka():
     """Check Nuitka installation"""
-    print("\n[CHECK 2] Nuitka")
+    lines = []
+    log = lines.append
+    
+    log("\n[CHECK 2] Nuitka")
+    
+    # Not importable means not installed, no need to start an interpreter
+    if find_spec('nuitka') is None:
+        log("  Installed: No")
+        log("  Status: FAIL")
+        log("  Fix: pip install nuitka")
+        return False, lines
     
     try:
-        result = subprocess.run(
-            [sys.executable, '-m', 'nuitka', '--version'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = cached_run([sys.executable, '-m', 'nuitka', '--version'], timeout=10)
         
         if result.returncode == 0:
             version = result.stdout.strip().split('\n')[0]
-            print(f"  Installed: {version}")
-            print("  Status: OK")
-            return True
+            log(f"  Installed: {version}")
+            log("  Status: OK")
+            return True, lines
         else:
-            print("  Installed: No")
-            print("  Status: FAIL")
-            print("  Fix: pip install nuitka")
-            return False
+            log("  Installed: No")
+            log("  Status: FAIL")
+            log("  Fix: pip install nuitka")
+            return False, lines
             
     except FileNotFoundError:
-        print("  Installed: No")
-        print("  Status: FAIL")
-        print("  Fix: pip install nuitka")
-        return False
+        log("  Installed: No")
+        log("  Status: FAIL")
+        log("  Fix: pip install nuitka")
+        return False, lines
     except Exception as e:
-        print(f"  Error: {e}")
-        print("  Status: FAIL")
-        return False
+        log(f"  Error: {e}")
+        log("  Status: FAIL")
+        return False, lines
 
 
 def check_msvc():
     """Check MSVC compiler"""
-    print("\n[CHECK 3] MSVC Compiler")
+    lines = []
+    log = lines.append
+    
+    log("\n[CHECK 3] MSVC Compiler")
     
     # Check for cl.exe
     try:
-        result = subprocess.run(
-            ['where', 'cl.exe'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = cached_run(['where', 'cl.exe'], timeout=5)
         
         if result.returncode == 0:
             path = result.stdout.strip().split('\n')[0]
-            print(f"  Found: {path}")
-            print("  Status: OK")
-            return True
+            log(f"  Found: {path}")
+            log("  Status: OK")
+            return True, lines
         else:
-            print("  Found: No")
-            print("  Status: FAIL")
-            print_msvc_help()
-            return False
+            log("  Found: No")
+            log("  Status: FAIL")
+            print_msvc_help(log)
+            return False, lines
             
     except Exception as e:
-        print(f"  Error: {e}")
-        print("  Status: WARN (could not verify)")
-        print_msvc_help()
-        return False
+        log(f"  Error: {e}")
+        log("  Status: WARN (could not verify)")
+        print_msvc_help(log)
+        return False, lines
 
 
-def print_msvc_help():
-    """Print help for installing MSVC"""
-    print("\n  How to fix:")
-    print("  1. Install Visual Studio Build Tools 2022")
-    print("     https://visualstudio.microsoft.com/downloads/")
-    print("  2. Select 'Desktop development with C++'")
-    print("  3. Run from 'x64 Native Tools Command Prompt'")
-    print("     OR")
-    print("  4. Run vcvarsall.bat before building:")
-    print('     "C:\\Program Files\\...\\vcvarsall.bat" x64')
+def print_msvc_help(log=print):
+    """Print help for installing MSVC (through log, when buffering)"""
+    log("\n  How to fix:")
+    log("  1. Install Visual Studio Build Tools 2022")
+    log("     https://visualstudio.microsoft.com/downloads/")
+    log("  2. Select 'Desktop development with C++'")
+    log("  3. Run from 'x64 Native Tools Command Prompt'")
+    log("     OR")
+    log("  4. Run vcvarsall.bat before building:")
+    log('     "C:\\Program Files\\...\\vcvarsall.bat" x64')
 
 
-def check_repo_structure():
+def check_repo_structure(cwd=None):
     """Check repository structure"""
-    print("\n[CHECK 4] Repository Structure")
+    lines = []
+    log = lines.append
     
-    cwd = Path.cwd()
-    print(f"  Current directory: {cwd}")
+    log("\n[CHECK 4] Repository Structure")
     
-    required_files = {
-        'run_netexec.py': 'Entry point',
-        'nxc': 'NetExec package',
-        'nxc/protocols': 'Protocol modules',
-        'nxc/modules': 'Extension modules',
-        'nxc/helpers/self_test.py': 'Self-test module',
-        'nxc/helpers/resource_manager.py': 'Path manager',
-    }
+    cwd = Path(cwd) if cwd is not None else Path.cwd()
+    cwd_str = os.fspath(cwd)
+    log(f"  Current directory: {cwd}")
     
     all_ok = True
     
-    for path, description in required_files.items():
-        path_obj = cwd / path
-        exists = path_obj.exists()
+    # List each parent directory once and test names against that listing,
+    # instead of one stat() per required path
+    listings = {}
+    
+    def present(relative):
+        parent, _, name = relative.rpartition('/')
+        if parent not in listings:
+            try:
+                with os.scandir(cwd_str + os.sep + parent if parent else cwd_str) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        return name in listings[parent]
+    
+    for path, description in _REQUIRED_FILES:
+        exists = present(path)
         
         status = "OK" if exists else "MISSING"
-        print(f"  [{status:7}] {path:40} ({description})")
+        log(f"  [{status:7}] {path:40} ({description})")
         
         if not exists:
             all_ok = False
     
     if all_ok:
-        print("  Status: OK")
+        log("  Status: OK")
     else:
-        print("  Status: FAIL (missing required files)")
+        log("  Status: FAIL (missing required files)")
     
-    return all_ok
+    return all_ok, lines
 
 
 def check_dependencies():
     """Check Python dependencies"""
-    print("\n[CHECK 5] Python Dependencies")
+    lines = []
+    log = lines.append
     
-    # Try importing critical modules
+    log("\n[CHECK 5] Python Dependencies")
+    
+    # Critical modules
     imports = {
         'nxc': 'NetExec package',
         'nxc.netexec': 'NetExec main',
@@ -159,82 +255,152 @@ def check_dependencies():
     
     all_ok = True
     
+    # Locate the modules without executing them; the import test at the end
+    # is what actually loads NetExec
     for module, description in imports.items():
         try:
-            __import__(module)
-            print(f"  [OK     ] {module:30} ({description})")
-        except ImportError as e:
-            print(f"  [FAIL   ] {module:30} ({description})")
-            print(f"            Error: {e}")
+            spec = find_spec(module)
+            error = f"No module named '{module}'"
+        except (ImportError, ValueError) as e:
+            spec, error = None, e
+        
+        if spec is not None:
+            log(f"  [OK     ] {module:30} ({description})")
+        else:
+            log(f"  [FAIL   ] {module:30} ({description})")
+            log(f"            Error: {error}")
             all_ok = False
     
     if all_ok:
-        print("  Status: OK")
+        log("  Status: OK")
     else:
-        print("  Status: FAIL")
-        print("  Fix: pip install -e .")
+        log("  Status: FAIL")
+        log("  Fix: pip install -e .")
     
-    return all_ok
+    return all_ok, lines
 
 
-def check_disk_space():
+def check_disk_space(cwd=None):
     """Check available disk space"""
-    print("\n[CHECK 6] Disk Space")
+    lines = []
+    log = lines.append
     
-    cwd = Path.cwd()
+    log("\n[CHECK 6] Disk Space")
+    
+    cwd = cwd if cwd is not None else Path.cwd()
     
     try:
         import shutil
         total, used, free = shutil.disk_usage(cwd)
         
         free_gb = free / (1024**3)
-        print(f"  Free space: {free_gb:.1f} GB")
+        log(f"  Free space: {free_gb:.1f} GB")
         
         if free_gb >= 2:
-            print("  Status: OK (2+ GB recommended)")
-            return True
+            log("  Status: OK (2+ GB recommended)")
+            return True, lines
         else:
-            print("  Status: WARN (less than 2 GB free)")
-            return True  # Warning, not failure
+            log("  Status: WARN (less than 2 GB free)")
+            return True, lines  # Warning, not failure
             
     except Exception as e:
-        print(f"  Error: {e}")
-        print("  Status: WARN (could not check)")
-        return True
+        log(f"  Error: {e}")
+        log("  Status: WARN (could not check)")
+        return True, lines
 
 
-def check_previous_builds():
+def check_previous_builds(cwd=None):
     """Check for previous build artifacts"""
-    print("\n[CHECK 7] Previous Builds")
+    lines = []
+    log = lines.append
     
-    cwd = Path.cwd()
+    log("\n[CHECK 7] Previous Builds")
+    
+    cwd = Path(cwd) if cwd is not None else Path.cwd()
     dist_dir = cwd / 'dist'
     build_dir = cwd / 'build'
     
     if dist_dir.exists():
         files = list(dist_dir.iterdir())
-        print(f"  dist/ exists with {len(files)} files")
-        print("  Note: Will be cleaned before build")
+        log(f"  dist/ exists with {len(files)} files")
+        log("  Note: Will be cleaned before build")
     else:
-        print("  dist/ does not exist (clean)")
+        log("  dist/ does not exist (clean)")
     
     if build_dir.exists():
-        print("  build/ exists")
-        print("  Note: Will be cleaned before build")
+        log("  build/ exists")
+        log("  Note: Will be cleaned before build")
+    else:
+        log("  build/ does not exist (clean)")
+    
+    log("  Status: OK")
+    return True, lines
+
+
+def check_bytecode_cache(cwd=None):
+    """
+    Precompile nxc/ so later interpreter starts load bytecode instead of parsing.
+    Writes .pyc files next to the sources, and starts its own worker processes,
+    so call it from the main thread with no other threads running.
+    """
+    lines = []
+    log = lines.append
+    
+    log("\n[CHECK 8] Bytecode Cache")
+    
+    nxc_dir = (Path(cwd) if cwd is not None else Path.cwd()) / 'nxc'
+    if not nxc_dir.is_dir():
+        log("  nxc/ not found, nothing to compile")
+        log("  Status: WARN (skipped)")
+        return True, lines
+    
+    # compileall writes even under -B, but a cache prefix (often a temp dir)
+    # moves the files away from the sources where other runs won't find them
+    if sys.pycache_prefix:
+        log(f"  Writing bytecode to {sys.pycache_prefix} (PYTHONPYCACHEPREFIX)")
     else:
-        print("  build/ does not exist (clean)")
+        log("  Writing bytecode to __pycache__ directories under nxc/")
+    
+    try:
+        # optimize=-1 matches the running interpreter, so the caches get used
+        # by the import test and the build; workers=0 uses every CPU
+        ok = compileall.compile_dir(nxc_dir, quiet=1, workers=0, optimize=-1, legacy=False)
+    except Exception as e:
+        log(f"  Error: {e}")
+        log("  Status: WARN (could not precompile)")
+        return True, lines
+    
+    cache_root = nxc_dir
+    if sys.pycache_prefix:
+        # The prefix mirrors the absolute source tree (drive letter dropped)
+        tail = os.path.splitdrive(os.path.abspath(nxc_dir))[1].lstrip(os.sep)
+        cache_root = Path(sys.pycache_prefix, tail)
+    suffix = f".{sys.implementation.cache_tag}.pyc"
+    cached = sum(
+        name.endswith(suffix)
+        for _, _, files in os.walk(cache_root)
+        for name in files
+    )
+    log(f"  Cached modules: {cached}")
     
-    print("  Status: OK")
-    return True
+    if ok:
+        log("  Status: OK")
+    else:
+        log("  Status: FAIL (some files did not compile)")
+    return ok, lines
 
 
 def test_import_run_netexec():
     """Test if run_netexec.py can be imported"""
-    print("\n[CHECK 8] run_netexec.py Import Test")
+    return _import_run_netexec(Path.cwd())
+
+
+def _import_run_netexec(cwd):
+    """Import run_netexec.py from cwd and make a quick API call"""
+    print("\n[CHECK 9] run_netexec.py Import Test")
     
     try:
         # Add current directory to path
-        cwd = Path.cwd()
         if str(cwd) not in sys.path:
             sys.path.insert(0, str(cwd))
         
@@ -244,7 +410,7 @@ def test_import_run_netexec():
         print("  Import: OK")
         
         # Try a quick test
-        result = run_netexec(['--version'])
+        result = get_or_probe('netexec_version', lambda: run_netexec(['--version']))
         
         if isinstance(result, dict) and 'returncode' in result:
             print("  API function: OK")
@@ -293,17 +459,45 @@ def main():
     print(" " * 20 + "NetExec Pre-Build Checker")
     print("=" * 70)
     
-    results = {
-        'Python Version': check_python(),
-        'Nuitka Installation': check_nuitka(),
-        'MSVC Compiler': check_msvc(),
-        'Repository Structure': check_repo_structure(),
-        'Python Dependencies': check_dependencies(),
-        'Disk Space': check_disk_space(),
-        'Previous Builds': check_previous_builds(),
-        'Import Test': test_import_run_netexec(),
+    # Looked up once and handed to every check that works relative to it
+    cwd = Path.cwd()
+    
+    checks = {
+        'Python Version': check_python,
+        'Nuitka Installation': check_nuitka,
+        'MSVC Compiler': check_msvc,
+        'Repository Structure': partial(check_repo_structure, cwd),
+        'Python Dependencies': check_dependencies,
+        'Disk Space': partial(check_disk_space, cwd),
+        'Previous Builds': partial(check_previous_builds, cwd),
     }
     
+    # Start the external probes together so their start-up and pipe reads overlap
+    probes = [(['where', 'cl.exe'], 5)]
+    if find_spec('nuitka') is not None:
+        probes.append(([sys.executable, '-m', 'nuitka', '--version'], 10))
+    prime_probes(probes)
+    
+    # The checks are independent and mostly wait on subprocesses or the
+    # filesystem, so run them together. Each returns (ok, lines) and the
+    # lines are printed in the order above once that check is done.
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(check) for name, check in checks.items()}
+        for name, future in futures.items():
+            ok, lines = future.result()
+            print('\n'.join(lines))
+            results[name] = ok
+    
+    # On the main thread once the pool is done: compileall forks its own
+    # worker processes, which should not happen in a multi-threaded process
+    ok, lines = check_bytecode_cache(cwd)
+    print('\n'.join(lines))
+    results['Bytecode Cache'] = ok
+    
+    # Last and on the main thread: it changes sys.path and swaps sys.argv/stdout
+    results['Import Test'] = _import_run_netexec(cwd)
+    
     ready = print_summary(results)
     
     if ready:
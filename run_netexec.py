@@ -10,7 +10,6 @@ import sys
 import io
 import os
 from contextlib import contextmanager
-from typing import Dict, List
 from pathlib import Path
 import traceback
 
@@ -20,6 +19,15 @@ def initialize_path_independence():
     Initialize paths before NetExec loads.
     Ensures NetExec works from any directory.
     """
+    # Snapshot sys.path once; membership tests are then set lookups
+    path_set = set(sys.path)
+    
+    def add_to_path(path):
+        entry = str(path)
+        if entry not in path_set:
+            sys.path.insert(0, entry)
+            path_set.add(entry)
+    
     try:
         is_frozen = getattr(sys, 'frozen', False)
         
@@ -29,43 +37,71 @@ def initialize_path_independence():
             else:
                 base_path = Path(sys.executable).parent
             
-            if str(base_path) not in sys.path:
-                sys.path.insert(0, str(base_path))
+            add_to_path(base_path)
         else:
             try:
                 import nxc
                 base_path = Path(nxc.__file__).parent.parent
                 
-                if str(base_path) not in sys.path:
-                    sys.path.insert(0, str(base_path))
+                add_to_path(base_path)
                     
             except ImportError:
                 script_path = Path(__file__).parent
                 
                 if (script_path / 'nxc').exists():
                     base_path = script_path
-                    if str(base_path) not in sys.path:
-                        sys.path.insert(0, str(base_path))
+                    add_to_path(base_path)
                 else:
                     print(f"Warning: Could not locate nxc module. Script at: {script_path}", 
                           file=sys.stderr)
             
     except Exception as e:
         print(f"Warning: Path initialization issue: {e}", file=sys.stderr)
-        traceback.print_exc()
+        if os.environ.get('NXC_DEBUG'):
+            traceback.print_exc()
 
 
 # Initialize before any NetExec imports
 initialize_path_independence()
 
+# Resolve NetExec's entry point once; run_netexec() reports a failure per call
+try:
+    from nxc.netexec import main as _NXC_MAIN
+    _NXC_IMPORT_ERROR = None
+except Exception as e:
+    _NXC_MAIN = None
+    _NXC_IMPORT_ERROR = (f"{type(e).__name__}: {e}", traceback.format_exc())
+
+
+class _ListIO(io.TextIOBase):
+    """
+    Write-only text sink that keeps the written fragments in a list.
+    getvalue() joins them once, StringIO copies on every write and again on read.
+    """
+    __slots__ = ('_parts',)
+    
+    def __init__(self):
+        super().__init__()
+        self._parts = []
+    
+    def writable(self):
+        return True
+    
+    def write(self, s):
+        self._parts.append(s)
+        return len(s)
+    
+    def getvalue(self):
+        return ''.join(self._parts)
+
 
 @contextmanager
 def capture_output():
     """Context manager to capture stdout and stderr"""
     old_stdout = sys.stdout
     old_stderr = sys.stderr
-    stdout_capture = io.StringIO()
-    stderr_capture = io.StringIO()
+    stdout_capture = _ListIO()
+    stderr_capture = _ListIO()
     
     try:
         sys.stdout = stdout_capture
@@ -76,12 +112,14 @@ def capture_output():
         sys.stderr = old_stderr
 
 
-def run_netexec(args: List[str]) -> Dict:
+def run_netexec(args: list[str], *, include_traceback: bool = False) -> dict:
     """
     Runs netexec with the given CLI args and returns output in structured form.
     
     Args:
         args: List of command-line arguments (e.g., ['smb', '192.168.1.1', '-u', 'admin'])
+        include_traceback: Append the full traceback to stderr when NetExec raises,
+            otherwise only the exception type and message are reported
     
     Returns:
         dict: {
@@ -95,6 +133,18 @@ def run_netexec(args: List[str]) -> Dict:
         result = run_netexec(['--help'])
         print(result['stdout'])
     """
+    # Save original argv
+    original_argv = sys.argv.copy()
+    
+    try:
+        return _invoke(args, include_traceback)
+    finally:
+        # Restore original argv
+        sys.argv = original_argv
+
+
+def _invoke(args: list[str], include_traceback: bool = False) -> dict:
+    """Run NetExec's main() once with argv set to args, capturing its output"""
     result = {
         "returncode": 0,
         "stdout": "",
@@ -102,9 +152,6 @@ def run_netexec(args: List[str]) -> Dict:
         "parsed": {}
     }
     
-    # Save original argv
-    original_argv = sys.argv.copy()
-    
     try:
         # Set up arguments for NetExec
         sys.argv = ['netexec'] + args
@@ -112,30 +159,37 @@ def run_netexec(args: List[str]) -> Dict:
         # Capture output
         with capture_output() as (stdout_capture, stderr_capture):
             try:
-                # Import and run NetExec's main function
-                from nxc.netexec import main
-                
-                # Execute NetExec
-                exit_code = main()
-                result["returncode"] = exit_code if exit_code is not None else 0
+                if _NXC_MAIN is None:
+                    # Import failed at load time, report the original error
+                    summary, details = _NXC_IMPORT_ERROR
+                    result["returncode"] = 1
+                    result["stderr"] += f"\nException: {summary}\n"
+                    if include_traceback:
+                        result["stderr"] += details
+                else:
+                    # Execute NetExec
+                    exit_code = _NXC_MAIN()
+                    result["returncode"] = exit_code if exit_code is not None else 0
                 
             except SystemExit as e:
                 # NetExec might call sys.exit()
                 result["returncode"] = e.code if isinstance(e.code, int) else (1 if e.code else 0)
             except Exception as e:
                 result["returncode"] = 1
-                result["stderr"] += f"\nException: {str(e)}\n{traceback.format_exc()}"
+                # Rendering the stack is only worth it when the caller asked
+                result["stderr"] += f"\nException: {type(e).__name__}: {e}\n"
+                if include_traceback:
+                    result["stderr"] += traceback.format_exc()
         
-        # Get captured output
+        # Get captured output, keeping any exception report after it
         result["stdout"] = stdout_capture.getvalue()
-        result["stderr"] = stderr_capture.getvalue()
+        result["stderr"] = stderr_capture.getvalue() + result["stderr"]
         
     except Exception as e:
         result["returncode"] = 1
-        result["stderr"] = f"Fatal error: {str(e)}\n{traceback.format_exc()}"
-    finally:
-        # Restore original argv
-        sys.argv = original_argv
+        result["stderr"] = f"Fatal error: {type(e).__name__}: {e}\n"
+        if include_traceback or os.environ.get('NXC_DEBUG'):
+            result["stderr"] += traceback.format_exc()
     
     return result
 
@@ -149,7 +203,22 @@ def self_test() -> bool:
         # Use enhanced self-test if available
         from nxc.helpers.self_test import SelfTestRunner
         
-        runner = SelfTestRunner(run_netexec)
+        # In-process by default: no interpreter start-up or nxc import per call.
+        # NXC_SELFTEST_INPROC=0 isolates every run in its own process instead,
+        # which also lets the independent checks run concurrently.
+        if os.environ.get('NXC_SELFTEST_INPROC', '1') != '0':
+            runner = SelfTestRunner(run_netexec)
+        else:
+            from nxc.helpers.self_test import SubprocessRunner
+            from nxc.helpers.resource_manager import get_resource_manager
+            
+            # nxc's main() never runs in this process, so NXC_DB is set here
+            # for the database check and passed on to every child
+            os.environ.setdefault('NXC_DB', get_resource_manager().get_db_path())
+            
+            command = [sys.executable] if getattr(sys, 'frozen', False) else [sys.executable, os.path.abspath(__file__)]
+            runner = SelfTestRunner(SubprocessRunner(command), max_workers=8)
+        
         return runner.run_all_tests()
         
     except ImportError:
@@ -4,17 +4,18 @@ This demonstrates that the function captures output correctly.
 """
 
 from run_netexec import run_netexec
+from concurrent.futures import ProcessPoolExecutor
 import json
+import multiprocessing
+import sys
 
 
-def test_help():
-    """Test help command"""
+def _report_help(result):
+    """Print a help command result"""
     print("=" * 60)
     print("TEST 1: Help Command")
     print("=" * 60)
     
-    result = run_netexec(['--help'])
-    
     print(f"Return Code: {result['returncode']}")
     print(f"Stdout Length: {len(result['stdout'])} chars")
     print(f"Stderr Length: {len(result['stderr'])} chars")
@@ -23,54 +24,66 @@ def test_help():
     print("\n")
 
 
-def test_version():
-    """Test version command"""
+def test_help():
+    """Test help command"""
+    _report_help(run_netexec(['--help']))
+
+
+def _report_version(result):
+    """Print a version command result"""
     print("=" * 60)
     print("TEST 2: Version Command")
     print("=" * 60)
     
-    result = run_netexec(['--version'])
-    
     print(f"Return Code: {result['returncode']}")
     print(f"Output: {result['stdout'].strip()}")
     print("\n")
 
 
-def test_protocol_help():
-    """Test protocol help"""
+def test_version():
+    """Test version command"""
+    _report_version(run_netexec(['--version']))
+
+
+def _report_protocol_help(result):
+    """Print an SMB protocol help result"""
     print("=" * 60)
     print("TEST 3: SMB Protocol Help")
     print("=" * 60)
     
-    result = run_netexec(['smb', '--help'])
-    
     print(f"Return Code: {result['returncode']}")
     print(f"Stdout Length: {len(result['stdout'])} chars")
     print(f"First 300 chars:\n{result['stdout'][:300]}")
     print("\n")
 
 
-def test_invalid_command():
-    """Test invalid command handling"""
+def test_protocol_help():
+    """Test protocol help"""
+    _report_protocol_help(run_netexec(['smb', '--help']))
+
+
+def _report_invalid_command(result):
+    """Print an invalid command result"""
     print("=" * 60)
     print("TEST 4: Invalid Command")
     print("=" * 60)
     
-    result = run_netexec(['invalid_protocol'])
-    
     print(f"Return Code: {result['returncode']}")
     print(f"Stderr: {result['stderr'][:200]}")
     print("\n")
 
 
-def test_json_output():
-    """Test that we can serialize the result"""
+def test_invalid_command():
+    """Test invalid command handling"""
+    _report_invalid_command(run_netexec(['invalid_protocol']))
+
+
+def _report_json_output(result):
+    """Print a result and whether it serializes to JSON"""
     print("=" * 60)
     print("TEST 5: JSON Serialization")
     print("=" * 60)
     
-    result = run_netexec(['--version'])
-    
     try:
         json_str = json.dumps(result, indent=2)
         print("✓ Result is JSON serializable")
@@ -81,6 +94,34 @@ def test_json_output():
     print("\n")
 
 
+def test_json_output():
+    """Test that we can serialize the result"""
+    _report_json_output(run_netexec(['--version']))
+
+
+# Each test and the command line it checks, in run order
+TESTS = [
+    (_report_help, ['--help']),
+    (_report_version, ['--version']),
+    (_report_protocol_help, ['smb', '--help']),
+    (_report_invalid_command, ['invalid_protocol']),
+    (_report_json_output, ['--version']),
+]
+
+
+def run_batch(args_list):
+    """
+    Run every command line at once, one worker process each.
+    run_netexec swaps the process-wide sys.argv/stdout, so the runs need
+    separate processes to overlap. With fork the workers inherit the nxc
+    import already done here; spawn workers import it again.
+    """
+    ctx = multiprocessing.get_context('spawn' if sys.platform == 'win32' else 'fork')
+    with ProcessPoolExecutor(max_workers=len(args_list), mp_context=ctx) as executor:
+        futures = [executor.submit(run_netexec, args) for args in args_list]
+        return [future.result() for future in futures]
+
+
 if __name__ == "__main__":
     print("\n")
     print("╔" + "═" * 58 + "╗")
@@ -88,11 +129,9 @@ if __name__ == "__main__":
     print("╚" + "═" * 58 + "╝")
     print("\n")
     
-    test_help()
-    test_version()
-    test_protocol_help()
-    test_invalid_command()
-    test_json_output()
+    results = run_batch([args for _, args in TESTS])
+    for (report, _), result in zip(TESTS, results, strict=True):
+        report(result)
     
     print("=" * 60)
     print("All tests completed!")
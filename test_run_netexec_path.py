@@ -18,16 +18,17 @@ def test_old_implementation():
     print("=" * 70)
     
     # Simulate the OLD logic
-    script_path = Path(__file__).parent
+    script_path = os.path.dirname(os.path.abspath(__file__))
     base_path = script_path  # OLD: Always assumes script is in repo root
-    nxc_path = base_path / 'nxc'
+    nxc_path = base_path + os.sep + 'nxc'
+    nxc_exists = os.path.lexists(nxc_path)
     
     print(f"Script location: {script_path}")
     print(f"OLD base_path: {base_path}")
     print(f"OLD nxc_path: {nxc_path}")
-    print(f"nxc_path exists: {nxc_path.exists()}")
+    print(f"nxc_path exists: {nxc_exists}")
     
-    if nxc_path.exists():
+    if nxc_exists:
         print("✓ OLD logic WORKS (script is in repo root)")
     else:
         print("✗ OLD logic FAILS (script not in repo root)")
@@ -60,8 +61,8 @@ def test_new_implementation():
         print(f"  Error: {e}")
         print(f"  Fallback: Check if nxc is next to script")
         
-        nxc_fallback = script_path / 'nxc'
-        if nxc_fallback.exists():
+        nxc_fallback = os.fspath(script_path) + os.sep + 'nxc'
+        if os.path.lexists(nxc_fallback):
             print(f"  ✓ Fallback WORKS: Found {nxc_fallback}")
         else:
             print(f"  ✗ Fallback FAILS: No nxc at {nxc_fallback}")
@@ -97,12 +98,13 @@ def test_copy_script_scenario():
             print(f"Copied to: {copied_script}")
             print(f"nxc exists in temp: {(tmpdir_path / 'nxc').exists()}")
             
-            # Test if it works
+            # Test if it works, in a fresh interpreter started from the temp dir
             result = subprocess.run(
                 [sys.executable, str(copied_script), '--version'],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=10,
+                cwd=tmpdir
             )
             
             if result.returncode in [0, 1] and len(result.stdout) > 0: